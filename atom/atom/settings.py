@@ -249,6 +249,8 @@ if "pytest" in sys.argv[0]:
             "NAME": ":memory:",
         }
     }
+    # Быстрый хешер паролей: в тестах стойкость хеша не важна
+    PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
 
 # -----------------------------------------------------------------------------
 # Настройки логирования
@@ -321,6 +323,13 @@ LOGGING = {
     },
 }
 
+# В тестах журнал заказов принимает только предупреждения и ошибки:
+# INFO-записи о каждом сохранении заказа лишь замедляют прогон.
+# Дочерние логгеры задают уровень сами, поэтому поднимаем и его
+if "pytest" in sys.argv[0]:
+    for logger_name in ("order", "order.models", "order.services", "order.admin"):
+        LOGGING["loggers"][logger_name]["level"] = "WARNING"
+
 # Создаем директорию для логов если её нет
 LOGS_DIR = BASE_DIR / "logs"
 LOGS_DIR.mkdir(exist_ok=True)
@@ -2,6 +2,7 @@ import os
 import django
 import pytest
 from django.conf import settings
+from django.core.cache import cache
 from decimal import Decimal
 from django.core.management import call_command
 
@@ -35,6 +36,7 @@ from django.contrib.auth import get_user_model
 from status.models import Status, StatusGroup
 from balance.services.constants import TransactionTypeChoices
 from django.contrib.contenttypes.models import ContentType
+from status.services.constants import get_default_status_id, get_status_id
 from status.services.initial_data import (
     ORDER_STATUS_CONFIG,
     DELIVERY_STATUS_CONFIG,
@@ -68,11 +70,11 @@ def new_user(db):
 def balance(db, user):
     """Создание баланса для тестов."""
     balance = Balance.objects.get(user=user)
-    # Устанавливаем курс обмена
+    # Устанавливаем курс обмена в памяти и в БД без повторного чтения
+    balance.average_exchange_rate = Decimal("100.00")  # Фиксированный курс для тестов
     Balance.objects.filter(id=balance.id).update(
-        average_exchange_rate=Decimal("100.00")  # Фиксированный курс для тестов
+        average_exchange_rate=balance.average_exchange_rate
     )
-    balance.refresh_from_db()
     return balance
 
 
@@ -327,6 +329,19 @@ def reexport_delivery_status(db, delivery_status_group):
     return status
 
 
+@pytest.fixture(autouse=True)
+def clear_status_caches():
+    """Сброс кэшей статусов перед каждым тестом.
+
+    Откат тестовой транзакции не вызывает on_commit, поэтому сигналы
+    не сбрасывают кэши идентификаторов статусов и типов транзакций,
+    созданных в тесте.
+    """
+    get_default_status_id.cache_clear()
+    get_status_id.cache_clear()
+    cache.clear()
+
+
 @pytest.fixture(scope="function", autouse=True)
 def clean_tables(custom_db_setup, db):
     """Очистка таблиц перед каждым тестом."""
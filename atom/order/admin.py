@@ -200,7 +200,7 @@ class OrderAdmin(admin.ModelAdmin):
 
     def get_queryset(self, request):
         """Оптимизация запросов."""
-        return super().get_queryset(request).select_related("user", "site", "status")
+        return super().get_queryset(request).for_processing()
 
     def get_actions(self, request):
         """Получение списка доступных действий."""
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.9 on 2026-10-16 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("order", "0003_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="order",
+            name="internal_number",
+            field=models.CharField(
+                db_index=True,
+                error_messages={
+                    "unique": "Заказ с таким внутренним номером уже существует"
+                },
+                max_length=255,
+                unique=True,
+                verbose_name="Внутренний номер заказа",
+            ),
+        ),
+    ]
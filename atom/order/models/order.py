@@ -46,6 +46,7 @@ class Order(models.Model):
         max_length=255,
         unique=True,
         db_index=True,
+        error_messages={"unique": "Заказ с таким внутренним номером уже существует"},
     )
     external_number = models.CharField(
         "Внешний номер заказа",
@@ -112,7 +113,9 @@ class Order(models.Model):
         validator.validate_amounts(self.amount_euro, self.amount_rub)
 
         if self.pk:
-            old_instance = Order.objects.get(pk=self.pk)
+            old_instance = Order.objects.only(
+                "user", "status", "amount_euro", "amount_rub"
+            ).get(pk=self.pk)
             validator.validate_user_immutability(old_instance.user_id, self.user_id)
             self.amount_euro, self.amount_rub = validator.validate_paid_order_amounts(
                 self, old_instance
@@ -137,9 +140,8 @@ class Order(models.Model):
             )
 
         try:
-            OrderValidationService.validate_internal_number(
-                self.internal_number, self.pk
-            )
+            # Уникальность internal_number проверяет только full_clean;
+            # одновременную запись дубля отклонит уникальный индекс в БД
             self.full_clean()
 
             if not skip_status_processing:
@@ -4,6 +4,8 @@ from django.db import models, transaction
 from django.core.exceptions import ValidationError
 from status.models import Status
 from status.constants import OrderStatusCode, StatusGroupCode
+from status.services.constants import get_default_status_id
+from ..services.order_validation_service import OrderValidationService
 import logging
 
 logger = logging.getLogger(__name__)
@@ -12,6 +14,40 @@ logger = logging.getLogger(__name__)
 class OrderQuerySet(models.QuerySet):
     """QuerySet для модели Order с поддержкой массовых операций."""
 
+    def for_processing(self):
+        """Заказы со связями, которые читают стратегии обработки статусов.
+
+        Баланс пользователя, статус с группой и сайт загружаются одним JOIN,
+        чтобы обход заказов не порождал отдельные запросы на каждую связь.
+        """
+        return self.select_related("user__balance", "status__group", "site")
+
+    def bulk_create_validated(self, orders, batch_size=None):
+        """Массовое создание заказов с проверкой внутренних номеров.
+
+        Внутренние номера всей пачки проверяются одним запросом, заказы без
+        статуса получают статус по умолчанию. Как и при любом bulk_create,
+        стратегии статусов не выполняются.
+        """
+        OrderValidationService.validate_internal_number_batch(
+            [order.internal_number for order in orders]
+        )
+
+        for order in orders:
+            if not order.status_id:
+                order.status_id = get_default_status_id(
+                    self.model, group_code=StatusGroupCode.ORDER.value
+                )
+            # Связи и уникальность проверяются БД и пакетной проверкой выше,
+            # чтобы не выполнять запрос на каждый заказ
+            order.full_clean(exclude=["user", "site", "status"], validate_unique=False)
+
+        with transaction.atomic():
+            created = self.bulk_create(orders, batch_size=batch_size)
+
+        logger.info("Массово создано %d заказов", len(created))
+        return created
+
     def bulk_update_status(self, new_status, comment=None):
         """Массовое обновление статуса."""
         try:
@@ -65,8 +101,9 @@ class OrderQuerySet(models.QuerySet):
     def _lock_orders_for_update(self):
         """Блокировка заказов для обновления."""
         logger.debug("Блокировка заказов для обновления")
+        # Блокируются только строки заказов, статусы остаются доступными
         return list(
-            self.select_for_update()
+            self.select_for_update(of=("self",))
             .select_related("status", "status__group")
             .order_by("id")
         )
@@ -76,23 +113,21 @@ class OrderQuerySet(models.QuerySet):
         logger.debug("Проверка возможности изменения статуса для заказов")
         errors = []
         for order in orders:
-            try:
-                if order.status.code == OrderStatusCode.PAID:
-                    error_msg = f"Заказ {order.internal_number} уже оплачен"
-                    logger.warning(error_msg)
-                    raise ValidationError(error_msg)
-
-                if not order.status.group.is_transition_allowed(
-                    order.status.code, new_status.code
-                ):
-                    error_msg = (
-                        f"Недопустимый переход из '{order.status.name}' "
-                        f"в '{new_status.name}' для заказа {order.internal_number}"
-                    )
-                    logger.warning(error_msg)
-                    raise ValidationError(error_msg)
-            except ValidationError as e:
-                errors.append(str(e))
+            if order.status.code == OrderStatusCode.PAID:
+                error_msg = f"Заказ {order.internal_number} уже оплачен"
+                logger.warning(error_msg)
+                errors.append(error_msg)
+                continue
+
+            if not order.status.group.is_transition_allowed(
+                order.status.code, new_status.code
+            ):
+                error_msg = (
+                    f"Недопустимый переход из '{order.status.name}' "
+                    f"в '{new_status.name}' для заказа {order.internal_number}"
+                )
+                logger.warning(error_msg)
+                errors.append(error_msg)
 
         if errors:
             error_msg = "Невозможно обновить статусы:\n" + "\n".join(errors)
@@ -84,9 +84,9 @@ class Site(models.Model):
         }
 
     @property
-    def total_orders(self):
-        """Получение общего количества заказов."""
-        return self.orders_statistics["total_orders"]
+    def total_orders(self) -> int:
+        """Получение общего количества заказов одним COUNT без агрегатов."""
+        return self.orders.count()
 
     @property
     def total_profit(self) -> Decimal:
@@ -27,7 +27,7 @@ class OrderBulkService:
         """
         with transaction.atomic():
             # Получаем все заказы для обновления
-            orders = list(queryset.select_for_update())
+            orders = list(queryset.for_processing().select_for_update(of=("self",)))
 
             # Проверяем возможность обновления каждого заказа
             for order in orders:
@@ -2,17 +2,26 @@
 
 from decimal import Decimal
 from django.core.exceptions import ValidationError
+from balance.models import Balance
 from order.models import Order
 from status.constants import OrderStatusCode, ORDER_STATUS_TRANSITIONS
+from status.services.constants import get_transaction_type
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Точность денежных сумм и нулевое значение для расчетных полей
+_TWO_PLACES = Decimal("0.00")
+_ZERO = Decimal("0.00")
+
+# Шаблон комментария транзакции по заказу
+_COMMENT_TEMPLATE = "Оплата заказа №%s на сайте %s"
+
 
 class OrderService:
     """Сервис для работы с заказами вне модели."""
 
-    def calculate_expenses_and_profit(self, order) -> None:
+    def calculate_expenses_and_profit(self, order) -> tuple[Decimal, Decimal]:
         """Рассчитывает расходы и прибыль для заказа.
 
         Расходы вычисляются на основе суммы в евро и среднего курса обмена из баланса пользователя.
@@ -21,7 +30,13 @@ class OrderService:
         Args:
             order: Объект заказа
 
+        Returns:
+            tuple[Decimal, Decimal]: Расходы и прибыль по заказу
+
         Note:
+            Метод ничего не сохраняет: запись результата выполняет вызывающий
+            код одним UPDATE вместе с остальными полями.
+
             Дата оплаты (paid_at) устанавливается отдельно при смене статуса
             заказа на "оплачен" через соответствующую стратегию.
         """
@@ -30,38 +45,36 @@ class OrderService:
             order.internal_number,
         )
         try:
-            # Обновляем объект заказа из базы для получения актуальных данных
-            order.refresh_from_db()
-
-            # Получаем актуальный баланс пользователя
-            user_balance = order.user.balance
-            user_balance.refresh_from_db()
-
-            # Расчет расходов и прибыли с округлением до 2 знаков
-            two_places = Decimal("0.00")
+            # Получаем актуальные суммы заказа и курс баланса одним запросом
+            current = (
+                Order.objects.select_related("user__balance")
+                .only(
+                    "amount_euro",
+                    "amount_rub",
+                    "user__balance__average_exchange_rate",
+                )
+                .get(pk=order.pk)
+            )
+            user_balance = current.user.balance
 
             # Расходы считаем по среднему курсу из баланса
-            expense = (order.amount_euro * user_balance.average_exchange_rate).quantize(
-                two_places
-            )
+            expense = (
+                current.amount_euro * user_balance.average_exchange_rate
+            ).quantize(_TWO_PLACES)
 
             # Прибыль - разница между фактической суммой в рублях и расходами
-            profit = (order.amount_rub - expense).quantize(two_places)
-
-            print(f"DEBUG: amount_euro={order.amount_euro}")
-            print(f"DEBUG: exchange_rate={user_balance.average_exchange_rate}")
-            print(
-                f"DEBUG: amount_rub={order.amount_rub}"
-            )  # Используем существующую сумму
-            print(f"DEBUG: expense={expense}")
-            print(f"DEBUG: profit={profit}")
-
-            # Сохраняем все изменения атомарно
-            Order.objects.filter(pk=order.pk).update(
-                expense=expense,
-                profit=profit,
-            )
-            order.refresh_from_db()
+            profit = (current.amount_rub - expense).quantize(_TWO_PLACES)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "amount_euro=%s, exchange_rate=%s, amount_rub=%s, "
+                    "expense=%s, profit=%s",
+                    current.amount_euro,
+                    user_balance.average_exchange_rate,
+                    current.amount_rub,
+                    expense,
+                    profit,
+                )
 
             logger.info(
                 "Расчет завершен: заказ=%s, расходы=%.2f₽, прибыль=%.2f₽",
@@ -69,6 +82,7 @@ class OrderService:
                 expense,
                 profit,
             )
+            return expense, profit
         except Exception as e:
             logger.error(
                 "Ошибка при расчете для заказа %s: %s",
@@ -78,41 +92,55 @@ class OrderService:
             )
             raise
 
-    def calculate_amount_rub(self, order) -> Decimal:
+    def calculate_amount_rub(self, order, balance=None) -> Decimal:
         """Рассчитывает сумму в рублях на основе суммы в евро и среднего курса обмена.
 
         Args:
             order: Объект заказа
+            balance: Уже загруженный баланс пользователя (опционально)
 
         Returns:
             Decimal: Сумма в рублях
         """
-        # Получаем актуальный баланс пользователя
-        user_balance = order.user.balance
-        user_balance.refresh_from_db()
+        user_balance = balance if balance is not None else self.get_user_balance(order)
 
         # Расчет с округлением до 2 знаков
-        two_places = Decimal("0.00")
         return (order.amount_euro * user_balance.average_exchange_rate).quantize(
-            two_places
+            _TWO_PLACES
         )
 
     def reset_profit_expense_paid_at(self, order) -> None:
         """Обнулить расчетные поля profit, expense, paid_at у заказа."""
-        order.profit = Decimal("0.00")
-        order.expense = Decimal("0.00")
-        order.paid_at = None
-        order.save(
-            update_fields=["profit", "expense", "paid_at"],
-            skip_status_processing=True,
+        Order.objects.filter(pk=order.pk).update(
+            profit=_ZERO, expense=_ZERO, paid_at=None
         )
+        order.profit = _ZERO
+        order.expense = _ZERO
+        order.paid_at = None
+
+    def get_user_balance(self, order) -> Balance:
+        """Получить баланс пользователя заказа.
+
+        Если пользователь заказа еще не загружен, баланс читается по user_id
+        одним запросом, без отдельной загрузки пользователя.
+
+        Args:
+            order: Объект заказа
 
-    def validate_transaction_data(self, order) -> None:
+        Returns:
+            Balance: Баланс пользователя
+        """
+        if Order.user.is_cached(order):
+            return order.user.balance
+        return Balance.objects.get(user_id=order.user_id)
+
+    def validate_transaction_data(self, order, balance=None) -> None:
         """
         Валидация данных заказа перед созданием транзакции.
 
         Args:
             order: Объект заказа
+            balance: Уже загруженный баланс пользователя (опционально)
 
         Raises:
             ValidationError: Если данные не прошли валидацию
@@ -125,65 +153,38 @@ class OrderService:
                 {"order": "Суммы транзакции должны быть положительными"}
             )
 
-        if not order.user.balance:
+        if not (balance if balance is not None else self.get_user_balance(order)):
             raise ValidationError({"order": "У пользователя не создан баланс"})
 
-    def validate_serialized_transaction_data(self, data: dict) -> None:
-        """
-        Валидация сериализованных данных для транзакции.
-
-        Args:
-            data: Словарь с данными для транзакции
-
-        Raises:
-            ValidationError: Если данные не прошли валидацию
-        """
-        if not data:
-            raise ValidationError({"order": "Невозможно создать транзакцию для заказа"})
-
-        # Проверяем обязательные поля
-        required_fields = ["balance", "transaction_type", "amount_euro", "amount_rub"]
-        for field in required_fields:
-            if field not in data:
-                raise ValidationError(
-                    {"order": f"Отсутствует обязательное поле {field}"}
-                )
-
-        # Проверяем суммы
-        if data["amount_euro"] <= 0 or data["amount_rub"] <= 0:
-            raise ValidationError(
-                {"order": "Суммы транзакции должны быть положительными"}
-            )
-
-    def serialize_order_data_for_transaction(self, order) -> dict | None:
+    def serialize_order_data_for_transaction(self, order, balance=None) -> dict | None:
         """Подготовить данные заказа для транзакции.
 
         Args:
             order: Объект заказа
+            balance: Уже загруженный баланс пользователя (опционально)
 
         Returns:
             dict | None: Словарь с данными для создания транзакции или None
         """
-        # Валидация данных заказа
-        self.validate_transaction_data(order)
+        if balance is None:
+            balance = self.get_user_balance(order)
 
-        transaction_type = order.status.group.get_transaction_type_by_status(
-            order.status.code
-        )
+        # Валидация данных заказа; словарь ниже строится из уже проверенных полей
+        self.validate_transaction_data(order, balance=balance)
+
+        status = order.status
+        transaction_type = get_transaction_type(status.group_id, status.code)
         if not transaction_type:
             return None
 
         data = {
-            "balance": order.user.balance,
+            "balance": balance,
             "transaction_type": transaction_type,
             "amount_euro": order.amount_euro,
             "amount_rub": order.amount_rub,  # Используем фактическую сумму из заказа
-            "comment": f"Оплата заказа №{order.internal_number} на сайте {order.site.name}",
+            "comment": _COMMENT_TEMPLATE % (order.internal_number, order.site.name),
         }
 
-        # Валидация сериализованных данных
-        self.validate_serialized_transaction_data(data)
-
         return data
 
     def set_calculated_fields(
@@ -203,7 +204,9 @@ class OrderService:
 
         # Используем update для атомарного обновления полей
         Order.objects.filter(pk=order.pk).update(**update_fields)
-        order.refresh_from_db()
+        # Значения уже известны, поэтому обновляем объект без запроса к БД
+        for field, value in update_fields.items():
+            setattr(order, field, value)
 
     def validate_status_transition(self, from_status, to_status):
         allowed_transitions = ORDER_STATUS_TRANSITIONS.get(from_status.code, [])
@@ -40,11 +40,11 @@
     - Поддерживается асинхронная обработка изменений статусов
 """
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from django.forms import ValidationError
 from status.models import Status
-from status.services.constants import get_default_status
+from status.services.constants import get_default_status_id
 
 from .order_processor_service import OrderProcessor
 
@@ -90,23 +90,22 @@ class OrderStatusService:
 
         Args:
             order: Объект заказа для обработки
-            skip_status_processing: Флаг пропуска обработки статуса
+            skip_status_processing: Флаг пропуска обработки статуса. Если
+                установлен, проверка не выполняется и запросы к БД не делаются
 
         Returns:
             bool: True если статус был изменен, False в противном случае
+                (всегда False при skip_status_processing=True)
 
         Raises:
             ValidationError: Если изменение статуса невозможно
         """
-        status_changed = self._check_status_change(order)
+        if skip_status_processing:
+            return False
 
-        if status_changed and not skip_status_processing:
-            # Получаем старый заказ для сохранения статуса
-            old_order = (
-                order.__class__.objects.filter(pk=order.pk).only("status").first()
-            )
-            old_status = old_order.status if old_order else None
+        status_changed, old_status = self._check_status_change(order)
 
+        if status_changed:
             success = self.order_processor.execute_status_strategy(order, old_status)
             if not success:
                 raise ValidationError(
@@ -115,39 +114,49 @@ class OrderStatusService:
 
         return status_changed
 
-    def _check_status_change(self, order: "Order") -> bool:
+    def _check_status_change(
+        self, order: "Order"
+    ) -> tuple[bool, Optional["Status"]]:
         """
         Проверка на изменение статуса.
 
         Проверяет, был ли изменен статус заказа и возможен ли такой переход.
-        Для новых заказов устанавливает начальный статус.
+        Для новых заказов устанавливает начальный статус. Новый статус
+        записывается в БД вызывающим кодом (Order.save или массовое
+        обновление), поэтому проверка обходится одним запросом.
 
         Args:
             order: Объект заказа для проверки
 
         Returns:
-            bool: True если статус изменен или установлен, False в противном случае
+            tuple[bool, Status | None]: Флаг изменения или установки статуса
+                и статус заказа до изменения (None для новых заказов)
 
         Raises:
             ValidationError: При невозможности установки или изменения статуса
         """
         # Для нового заказа без статуса
         if not order.pk:
-            return False if order.status_id else self._set_initial_status(order)
-
-        # Получаем старый заказ только если он существует
-        old_order = order.__class__.objects.filter(pk=order.pk).only("status").first()
+            if order.status_id:
+                return False, None
+            return self._set_initial_status(order), None
+
+        old_order = (
+            order.__class__.objects.filter(pk=order.pk)
+            .select_related("status__group")
+            .only("status__code", "status__group__allowed_status_transitions")
+            .first()
+        )
         if not old_order:
-            return False
+            return False, None
 
         # Проверяем изменение статуса
-        if old_order.status != order.status:
+        if old_order.status_id != order.status_id:
+            old_status = old_order.status
             self._validate_status_change(old_order, order.status.code)
-            # Нужно сохранить новый статус
-            order.__class__.objects.filter(pk=order.pk).update(status=order.status)
-            return True
+            return True, old_status
 
-        return False
+        return False, None
 
     def _set_initial_status(self, order: "Order") -> bool:
         """
@@ -164,15 +173,13 @@ class OrderStatusService:
         Raises:
             ValidationError: Если невозможно получить статус по умолчанию
         """
-        default_status_code = get_default_status(
+        default_status_id = get_default_status_id(
             order.__class__, group_code="ORDER_STATUS_CONFIG"
         )
-        if not default_status_code:
+        if not default_status_id:
             raise ValidationError("Невозможно создать заказ без статуса по умолчанию")
 
-        order.status = Status.objects.get(
-            code=default_status_code, group__code="ORDER_STATUS_CONFIG"
-        )
+        order.status_id = default_status_id
         return True
 
     def _validate_status_change(self, order: "Order", new_status_code: str) -> None:
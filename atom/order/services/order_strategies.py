@@ -37,7 +37,9 @@
     - При ошибках выбрасывается ValidationError
 """
 
+import logging
 from abc import ABC, abstractmethod
+from django.db import transaction
 from django.utils import timezone
 from django.core.exceptions import ValidationError
 from order.models import Order
@@ -46,6 +48,18 @@ from decimal import Decimal
 from balance.services.transaction_service import TransactionProcessor
 from order.services.order_service import OrderService
 
+logger = logging.getLogger(__name__)
+
+_TWO_PLACES = Decimal("0.01")
+
+
+def _is_balance_cached(order: Order) -> bool:
+    """Проверить, загружен ли баланс пользователя вместе с заказом."""
+    if not Order.user.is_cached(order):
+        return False
+    user = order.user
+    return type(user).balance.is_cached(user)
+
 
 class OrderStrategy(ABC):
     """Стратегия для работы с заказами."""
@@ -77,22 +91,38 @@ class NewOrderStrategy(OrderStrategy):
 class PaidOrderStrategy(OrderStrategy):
     """Стратегия для обработки оплаченного заказа."""
 
-    def __init__(self):
-        """Инициализация стратегии."""
-        self.transaction_service = TransactionProcessor()
-        self.order_service = OrderService()
+    # Сервисы не хранят состояния, поэтому разделяются всеми экземплярами
+    transaction_service = TransactionProcessor()
+    order_service = OrderService()
 
+    @transaction.atomic
     def handle_order_status_config(self, order: Order) -> bool:
-        """Обработать оплаченный заказ."""
-        if order.paid_at:
+        """Обработать оплаченный заказ.
+
+        Строка заказа блокируется до конца транзакции, поэтому проверка
+        paid_at и запись расчетных полей выполняются без гонки между
+        параллельными повторами оплаты.
+        """
+        paid_at = (
+            Order.objects.select_for_update(of=("self",))
+            .values_list("paid_at", flat=True)
+            .get(pk=order.pk)
+        )
+        if paid_at:
             raise ValidationError({"order": "Заказ уже оплачен"})
 
         # 1. Сначала рассчитываем расходы по среднему курсу баланса
+        if not _is_balance_cached(order):
+            logger.debug(
+                "Баланс для заказа %s не загружен заранее, используйте "
+                "Order.objects.for_processing()",
+                order.internal_number,
+            )
         balance = order.user.balance
         expense = (order.amount_euro * balance.average_exchange_rate).quantize(
-            Decimal("0.01")
+            _TWO_PLACES
         )
-        profit = order.amount_rub - expense
+        profit = (order.amount_rub - expense).quantize(_TWO_PLACES)
 
         # 2. Готовим данные для транзакции с правильными суммами
         order_data = {
@@ -104,34 +134,39 @@ class PaidOrderStrategy(OrderStrategy):
         }
 
         # 3. Выполняем транзакцию
-        transaction = self.transaction_service.execute_transaction(order_data)
-
-        # 4. После успешной транзакции устанавливаем поля
-        if transaction:
-            self.order_service.set_calculated_fields(
-                order=order,
-                expense=expense,
-                profit=profit,
-                paid_at=timezone.now(),
+        executed = self.transaction_service.execute_transaction(order_data)
+
+        # 4. После успешной транзакции записываем расчетные поля одним UPDATE
+        if executed:
+            paid_at = timezone.now()
+            Order.objects.filter(pk=order.pk).update(
+                expense=expense, profit=profit, paid_at=paid_at
             )
+            order.expense = expense
+            order.profit = profit
+            order.paid_at = paid_at
 
-        return bool(transaction)
+        return bool(executed)
 
 
 class RefundedOrderStrategy(OrderStrategy):
     """Стратегия для обработки возвращенного заказа."""
 
-    def __init__(self):
-        """Инициализация стратегии."""
-        self.transaction_service = TransactionProcessor()
-        self.order_service = OrderService()
+    transaction_service = TransactionProcessor()
+    order_service = OrderService()
 
+    @transaction.atomic
     def handle_order_status_config(self, order: Order) -> bool:
-        """Обработать возвращенный заказ."""
-        print(f"Обработка возвращенного заказа {order.id}")
-        # # Обнулить расчетные поля profit, expense, paid_at у заказа
-        self.order_service.reset_profit_expense_paid_at(order)
-        # # Подготовить данные заказа для транзакции
+        """Обработать возвращенный заказ.
+
+        Данные для транзакции берутся из заказа в памяти и проверяются до
+        первой записи, а обнуление расчетных полей и возврат средств
+        фиксируются одной транзакцией БД.
+        """
+        logger.debug("Обработка возвращенного заказа %s", order.id)
+        # Подготовить данные заказа для транзакции
         order_data = self.order_service.serialize_order_data_for_transaction(order)
+        # Обнулить расчетные поля profit, expense, paid_at у заказа
+        self.order_service.reset_profit_expense_paid_at(order)
 
         return self.transaction_service.execute_transaction(order_data)
@@ -2,7 +2,8 @@
 
 from decimal import Decimal
 from django.core.exceptions import ValidationError
-from status.constants import OrderStatusCode
+from status.constants import OrderStatusCode, StatusGroupCode
+from status.services.constants import get_status_id
 
 
 class OrderValidationService:
@@ -11,6 +12,9 @@ class OrderValidationService:
     @staticmethod
     def validate_amounts(amount_euro: Decimal, amount_rub: Decimal) -> None:
         """Валидация сумм заказа."""
+        if amount_euro > 0 and amount_rub > 0:
+            return
+
         errors = {}
 
         if amount_euro <= 0:
@@ -18,8 +22,7 @@ class OrderValidationService:
         if amount_rub <= 0:
             errors["amount_rub"] = "Цена в рублях должна быть больше 0"
 
-        if errors:
-            raise ValidationError(errors)
+        raise ValidationError(errors)
 
     @staticmethod
     def validate_user_immutability(old_user_id: int, new_user_id: int) -> None:
@@ -32,7 +35,10 @@ class OrderValidationService:
     @staticmethod
     def validate_paid_order_amounts(order, old_instance) -> tuple[Decimal, Decimal]:
         """Валидация сумм оплаченного заказа."""
-        if old_instance.status.code == OrderStatusCode.PAID:
+        paid_status_id = get_status_id(
+            StatusGroupCode.ORDER.value, OrderStatusCode.PAID.value
+        )
+        if old_instance.status_id == paid_status_id:
             if (
                 order.amount_euro != old_instance.amount_euro
                 or order.amount_rub != old_instance.amount_rub
@@ -41,16 +47,28 @@ class OrderValidationService:
         return order.amount_euro, order.amount_rub
 
     @staticmethod
-    def validate_internal_number(
-        internal_number: str, order_id: int | None = None
-    ) -> None:
-        """Валидация уникальности внутреннего номера."""
+    def validate_internal_number_batch(internal_numbers: list[str]) -> None:
+        """Валидация уникальности пачки внутренних номеров одним запросом."""
         from order.models import Order
 
-        qs = Order.objects.filter(internal_number=internal_number)
-        if order_id:
-            qs = qs.exclude(id=order_id)
-        if qs.exists():
+        unique_numbers = set()
+        duplicates = set()
+        for internal_number in internal_numbers:
+            if internal_number in unique_numbers:
+                duplicates.add(internal_number)
+            unique_numbers.add(internal_number)
+
+        duplicates.update(
+            Order.objects.filter(internal_number__in=unique_numbers).values_list(
+                "internal_number", flat=True
+            )
+        )
+        if duplicates:
             raise ValidationError(
-                {"internal_number": "Заказ с таким внутренним номером уже существует"}
+                {
+                    "internal_number": (
+                        "Заказы с такими внутренними номерами уже существуют: "
+                        + ", ".join(sorted(duplicates))
+                    )
+                }
             )
@@ -47,6 +47,32 @@ def status_group(db):
     return group
 
 
+@pytest.fixture(scope="session")
+def order_statuses(django_db_setup, django_db_blocker):
+    """
+    Загружает статусы заказов из начальных данных один раз за сессию.
+
+    Статусы создаются при миграции, поэтому переживают откат транзакций
+    отдельных тестов.
+
+    Returns:
+        dict: Словарь {код_статуса: Status}
+    """
+    with django_db_blocker.unblock():
+        return {
+            status.code: status
+            for status in Status.objects.filter(
+                group__code="ORDER_STATUS_CONFIG"
+            ).select_related("group")
+        }
+
+
+@pytest.fixture
+def default_order_status(order_statuses):
+    """Статус заказа по умолчанию из загруженных за сессию статусов."""
+    return next(status for status in order_statuses.values() if status.is_default)
+
+
 @pytest.fixture
 def status(db, status_group):
     """Создает статус для заказов."""
@@ -84,16 +110,15 @@ def user_with_balance(user):
     # Создаем баланс для пользователя, если его нет
     balance, _ = Balance.objects.get_or_create(user=user)
 
-    # Пополняем баланс пользователя
-    Transaction.objects.create(
+    # Пополняем баланс пользователя одной обработанной транзакцией;
+    # TransactionProcessor обновляет и сохраняет этот же объект баланса
+    Transaction(
         balance=balance,
         amount_euro=Decimal("1000.00"),
         amount_rub=Decimal("100000.00"),
         transaction_type=TransactionTypeChoices.REPLENISHMENT,
     ).save(process_transaction=True)
 
-    # Обновляем баланс из базы
-    balance.refresh_from_db()
     return user
 
 
@@ -102,39 +127,49 @@ def status_factory():
     """
     Фикстура для создания статусов в тестах.
 
+    Группа статусов и уже созданные статусы запоминаются в пределах теста,
+    поэтому повторные вызовы не обращаются к БД.
+
     Returns:
         callable: Функция для создания статуса с заданным кодом
     """
+    status_group = None
+    statuses = {}
+
+    def _get_status_group() -> StatusGroup:
+        nonlocal status_group
+        if status_group is None:
+            # Получаем content type для модели Order
+            content_type = ContentType.objects.get_for_model(Order)
+
+            # Создаем или получаем группу статусов
+            status_group, _ = StatusGroup.objects.get_or_create(
+                code="ORDER_STATUS_CONFIG",
+                defaults={
+                    "name": "Статусы заказа",
+                    "content_type": content_type,
+                    "allowed_status_transitions": {
+                        "new": ["paid"],
+                        "paid": ["refunded"],
+                        "refunded": ["new"],
+                    },
+                },
+            )
+        return status_group
 
     def _create_status(code: str) -> Status:
-        # Получаем content type для модели Order
-        content_type = ContentType.objects.get_for_model(Order)
-
-        # Создаем или получаем группу статусов
-        status_group, _ = StatusGroup.objects.get_or_create(
-            code="ORDER_STATUS_CONFIG",
-            defaults={
-                "name": "Статусы заказа",
-                "content_type": content_type,
-                "allowed_status_transitions": {
-                    "new": ["paid"],
-                    "paid": ["refunded"],
-                    "refunded": ["new"],
+        if code not in statuses:
+            # Создаем или получаем статус
+            statuses[code], _ = Status.objects.get_or_create(
+                code=code,
+                group=_get_status_group(),
+                defaults={
+                    "name": code.capitalize(),
+                    "is_default": code == "new",
+                    "order": 10,
                 },
-            },
-        )
-
-        # Создаем или получаем статус
-        status, _ = Status.objects.get_or_create(
-            code=code,
-            group=status_group,
-            defaults={
-                "name": code.capitalize(),
-                "is_default": code == "new",
-                "order": 10,
-            },
-        )
+            )
 
-        return status
+        return statuses[code]
 
     return _create_status
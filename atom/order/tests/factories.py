@@ -0,0 +1,26 @@
+"""Фабрики тестовых данных для заказов."""
+
+from decimal import Decimal
+
+import factory
+from factory.django import DjangoModelFactory
+
+from order.models import Order
+
+
+class OrderFactory(DjangoModelFactory):
+    """
+    Фабрика заказов для подготовки данных в тестах.
+
+    Пользователь, сайт и статус передаются явно. Для заказов, которые только
+    подготавливают состояние, используйте build_batch и bulk_create, чтобы
+    не запускать полный цикл Order.save().
+    """
+
+    class Meta:
+        model = Order
+
+    internal_number = factory.Sequence(lambda n: f"TEST-{n}")
+    external_number = factory.Sequence(lambda n: f"EXT-{n}")
+    amount_euro = Decimal("100.00")
+    amount_rub = Decimal("10000.00")
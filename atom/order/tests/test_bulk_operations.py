@@ -6,6 +6,7 @@ from django.core.exceptions import ValidationError
 from django.utils import timezone
 
 from order.models import Order
+from order.tests.factories import OrderFactory
 from status.constants import OrderStatusCode
 
 
@@ -16,19 +17,11 @@ class TestOrderBulkOperations:
     def test_bulk_status_update(self, user_with_balance, site, status, paid_status):
         """Тест массового обновления статуса заказов."""
         # Создаем несколько заказов
-        orders = []
-        for i in range(3):
-            order = Order.objects.create(
-                user=user_with_balance,
-                site=site,
-                status=status,
-                internal_number=f"TEST-{i}",
-                external_number=f"EXT-{i}",
-                amount_euro=Decimal("100.00"),
-                amount_rub=Decimal("10000.00"),
-                created_at=timezone.now().date(),
+        orders = Order.objects.bulk_create(
+            OrderFactory.build_batch(
+                3, user=user_with_balance, site=site, status=status
             )
-            orders.append(order)
+        )
 
         # Массовое обновление статуса
         Order.objects.filter(status=status).bulk_update_status(
@@ -91,19 +84,11 @@ class TestOrderBulkOperations:
     ):
         """Тест атомарности массового обновления."""
         # Создаем заказы
-        orders = []
-        for i in range(3):
-            order = Order.objects.create(
-                user=user_with_balance,
-                site=site,
-                status=status,
-                internal_number=f"TEST-{i}",
-                external_number=f"EXT-{i}",
-                amount_euro=Decimal("100.00"),
-                amount_rub=Decimal("10000.00"),
-                created_at=timezone.now().date(),
+        orders = Order.objects.bulk_create(
+            OrderFactory.build_batch(
+                3, user=user_with_balance, site=site, status=status
             )
-            orders.append(order)
+        )
 
         # Добавляем заказ, который вызовет ошибку
         paid_order = Order.objects.create(
@@ -222,19 +207,11 @@ class TestOrderBulkOperations:
         from django.db.utils import OperationalError
 
         # Создаем заказы
-        orders = []
-        for i in range(3):
-            order = Order.objects.create(
-                user=user_with_balance,
-                site=site,
-                status=status,
-                internal_number=f"TEST-{i}",
-                external_number=f"EXT-{i}",
-                amount_euro=Decimal("100.00"),
-                amount_rub=Decimal("10000.00"),
-                created_at=timezone.now().date(),
+        orders = Order.objects.bulk_create(
+            OrderFactory.build_batch(
+                3, user=user_with_balance, site=site, status=status
             )
-            orders.append(order)
+        )
 
         # Для PostgreSQL проверяем блокировку через nowait
         if connection.vendor == "postgresql":
@@ -273,3 +250,46 @@ class TestOrderBulkOperations:
         for order in orders:
             order.refresh_from_db()
             assert order.status == status
+
+    def test_bulk_create_validated(self, user_with_balance, site, status):
+        """Тест массового создания заказов с проверкой внутренних номеров."""
+        Order.objects.create(
+            user=user_with_balance,
+            site=site,
+            status=status,
+            internal_number="TEST-EXISTING",
+            external_number="EXT-EXISTING",
+            amount_euro=Decimal("100.00"),
+            amount_rub=Decimal("10000.00"),
+        )
+
+        def build_order(i, internal_number=None):
+            return Order(
+                user=user_with_balance,
+                site=site,
+                status=status,
+                internal_number=internal_number or f"TEST-{i}",
+                external_number=f"EXT-{i}",
+                amount_euro=Decimal("100.00"),
+                amount_rub=Decimal("10000.00"),
+            )
+
+        created = Order.objects.bulk_create_validated(
+            [build_order(i) for i in range(3)]
+        )
+        assert len(created) == 3
+        assert Order.objects.count() == 4
+
+        # Повтор внутри пачки и уже существующий номер отклоняются
+        with pytest.raises(ValidationError) as exc_info:
+            Order.objects.bulk_create_validated(
+                [
+                    build_order(3, "TEST-DUP"),
+                    build_order(4, "TEST-DUP"),
+                    build_order(5, "TEST-EXISTING"),
+                ]
+            )
+        error_message = str(exc_info.value)
+        assert "TEST-DUP" in error_message
+        assert "TEST-EXISTING" in error_message
+        assert Order.objects.count() == 4
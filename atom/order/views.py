@@ -5,45 +5,59 @@
 - Импорта заказов из Excel файла
 """
 
-import pandas as pd
+from functools import lru_cache
+from io import BytesIO
+
+from openpyxl import Workbook
 from django.http import HttpResponse
 from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib import admin
 
+from .admin import OrderAdmin
 from .models import Order
 
 
+@lru_cache(maxsize=1)
+def _build_orders_template() -> bytes:
+    """Собрать файл шаблона импорта заказов.
+
+    Шаблон не зависит от запроса, поэтому собирается один раз на процесс.
+    """
+    # Создаем шаблон для заполнения: заголовки и строка-пример
+    template_row = {
+        "Внутренний номер": "ORDER-001",
+        "Внешний номер": "SHOP-001",
+        "Сайт": "Название существующего сайта",
+        "Пользователь": "email@example.com",
+        "Статус": "Название существующего статуса",
+        "Сумма (EUR)": 100.00,
+        "Сумма (RUB)": 10000.00,
+        "Комментарий": "Пример комментария",
+    }
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(list(template_row))
+    sheet.append(list(template_row.values()))
+
+    buffer = BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
 @staff_member_required
 def download_orders_template(request):
     """Скачивание шаблона для импорта заказов."""
-    # Создаем шаблон для заполнения
-    template_data = [
-        {
-            "Внутренний номер": "ORDER-001",
-            "Внешний номер": "SHOP-001",
-            "Сайт": "Название существующего сайта",
-            "Пользователь": "email@example.com",
-            "Статус": "Название существующего статуса",
-            "Сумма (EUR)": 100.00,
-            "Сумма (RUB)": 10000.00,
-            "Комментарий": "Пример комментария",
-        }
-    ]
-    df = pd.DataFrame(template_data)
-
-    # Создаем response с шаблоном
+    # Создаем response с готовым шаблоном
     response = HttpResponse(
         content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
     )
     response["Content-Disposition"] = 'attachment; filename="orders_template.xlsx"'
-    df.to_excel(response, index=False, engine="openpyxl")
+    response.write(_build_orders_template())
     return response
 
 
 @staff_member_required
 def import_orders(request):
     """Обработка импорта заказов."""
-    from .admin import OrderAdmin
-
     order_admin = OrderAdmin(model=Order, admin_site=admin.site)
     return order_admin.import_from_xlsx(request)
@@ -1,8 +1,7 @@
 """Административный интерфейс для модели Package."""
 
 from django.contrib import admin
-from django.utils.html import format_html
-from django.db import models, transaction
+from django.db import models
 
 from .models import Package, PackageDelivery, PackageOrder, TransportCompany
 
@@ -21,35 +20,38 @@ class PackageAdmin(admin.ModelAdmin):
         "display_orders_count",
         "created_at",
     )
+    list_select_related = ("user",)
     list_filter = ("created_at", "user")
     search_fields = ("number", "user__username", "user__email", "comment")
     raw_id_fields = ("user",)
     date_hierarchy = "created_at"
     ordering = ("-created_at",)
 
+    @admin.display(description="Стоимость доставки", ordering="shipping_cost_eur")
     def display_shipping_cost_eur(self, obj):
         """Отображение стоимости доставки."""
-        return format_html("€{}", f"{obj.shipping_cost_eur:.2f}")
-
-    display_shipping_cost_eur.short_description = "Стоимость доставки"
+        return f"€{obj.shipping_cost_eur:.2f}"
 
+    @admin.display(description="Комиссия", ordering="fee_cost_eur")
     def display_fee_cost_eur(self, obj):
         """Отображение комиссии."""
-        return format_html("€{}", f"{obj.fee_cost_eur:.2f}")
-
-    display_fee_cost_eur.short_description = "Комиссия"
+        return f"€{obj.fee_cost_eur:.2f}"
 
+    @admin.display(description="Общая стоимость")
     def display_total_cost_eur(self, obj):
         """Отображение общей стоимости."""
-        return format_html("€{}", f"{obj.total_cost_eur:.2f}")
+        return f"€{obj.total_cost_eur:.2f}"
 
-    display_total_cost_eur.short_description = "Общая стоимость"
+    def get_queryset(self, request):
+        """Добавляем количество заказов в запрос списка посылок."""
+        return (
+            super().get_queryset(request).annotate(orders_count=models.Count("orders"))
+        )
 
+    @admin.display(description="Кол-во заказов", ordering="orders_count")
     def display_orders_count(self, obj):
         """Отображение количества заказов."""
-        return obj.orders.count()
-
-    display_orders_count.short_description = "Кол-во заказов"
+        return obj.orders_count
 
 
 @admin.register(PackageDelivery)
@@ -66,6 +68,8 @@ class PackageDeliveryAdmin(admin.ModelAdmin):
         "display_price_rub_for_kg",
         "paid_at",
     )
+    # Статус выводится вместе с названием группы
+    list_select_related = ("package", "transport_company", "status__group")
     list_filter = ("status", "transport_company", "created_at", "paid_at")
     search_fields = (
         "tracking_number",
@@ -81,17 +85,15 @@ class PackageDeliveryAdmin(admin.ModelAdmin):
     date_hierarchy = "created_at"
     ordering = ("-created_at",)
 
+    @admin.display(description="Стоимость доставки", ordering="shipping_cost_rub")
     def display_shipping_cost_rub(self, obj):
         """Отображение стоимости доставки в рублях."""
-        return format_html("₽{}", "{:.2f}".format(obj.shipping_cost_rub))
-
-    display_shipping_cost_rub.short_description = "Стоимость доставки"
+        return f"₽{obj.shipping_cost_rub:.2f}"
 
+    @admin.display(description="Цена за кг", ordering="price_rub_for_kg")
     def display_price_rub_for_kg(self, obj):
         """Отображение стоимости за кг."""
-        return format_html("₽{}", "{:.2f}".format(obj.price_rub_for_kg))
-
-    display_price_rub_for_kg.short_description = "Цена за кг"
+        return f"₽{obj.price_rub_for_kg:.2f}"
 
     fieldsets = (
         (
@@ -129,28 +131,22 @@ class PackageDeliveryAdmin(admin.ModelAdmin):
     def formfield_for_foreignkey(self, db_field, request, **kwargs):
         """Переопределяем выбор посылок."""
         if db_field.name == "package":
+            # Посылки без доставки выбираются подзапросом, без JOIN и DISTINCT
+            free_packages = ~models.Q(
+                pk__in=PackageDelivery.objects.values("package_id")
+            )
             if object_id := request.resolver_match.kwargs.get("object_id"):
                 # Редактирование существующей доставки
                 try:
                     current_delivery = self.get_object(request, object_id)
                     kwargs["queryset"] = Package.objects.filter(
-                        models.Q(id=current_delivery.package_id)
-                        | models.Q(packagedelivery__isnull=True)
-                    ).distinct()
-                except (PackageDelivery.DoesNotExist, AttributeError):
-                    kwargs["queryset"] = Package.objects.filter(
-                        packagedelivery__isnull=True
+                        models.Q(pk=current_delivery.package_id) | free_packages
                     )
+                except (PackageDelivery.DoesNotExist, AttributeError):
+                    kwargs["queryset"] = Package.objects.filter(free_packages)
             else:
                 # Создание новой доставки
-                kwargs["queryset"] = Package.objects.filter(
-                    packagedelivery__isnull=True
-                )
-
-            # Для отладки
-            print(
-                f"Available packages: {list(kwargs['queryset'].values_list('id', 'number'))}"
-            )
+                kwargs["queryset"] = Package.objects.filter(free_packages)
 
         return super().formfield_for_foreignkey(db_field, request, **kwargs)
 
@@ -163,27 +159,14 @@ class TransportCompanyAdmin(admin.ModelAdmin):
     list_filter = ("is_active", "is_default")
     search_fields = ("name",)
 
-    def save_model(self, request, obj, form, change):
-        """
-        Переопределяем сохранение модели в админке.
-        Используем транзакцию для атомарного обновления флага is_default.
-        """
-        with transaction.atomic():
-            if obj.is_default:  # Если компания помечена как default
-                # Снимаем флаг у всех компаний
-                TransportCompany.objects.filter(is_default=True).update(
-                    is_default=False
-                )
-
-            # Сохраняем новую/измененную компанию
-            super().save_model(request, obj, form, change)
-
 
 @admin.register(PackageOrder)
 class PackageOrderAdmin(admin.ModelAdmin):
     """Административный интерфейс для модели PackageOrder."""
 
     list_display = ("package", "order", "created_at")
+    # Строка заказа включает его статус с названием группы
+    list_select_related = ("package", "order__status__group")
     list_filter = ("created_at",)
     search_fields = (
         "package__number",
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.9 on 2026-10-16 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("package", "0003_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="package",
+            index=models.Index(
+                fields=["created_at"], name="package_pac_created_d1e448_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="packagedelivery",
+            index=models.Index(
+                fields=["status", "transport_company"],
+                name="package_pac_status__543843_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="packagedelivery",
+            index=models.Index(
+                fields=["created_at"], name="package_pac_created_b15354_idx"
+            ),
+        ),
+    ]
@@ -44,6 +44,7 @@ class Package(models.Model):
         verbose_name = "Посылка"
         verbose_name_plural = "Посылки"
         unique_together = ("user", "number")
+        indexes = [models.Index(fields=["created_at"])]
         constraints = [
             models.UniqueConstraint(
                 fields=["user", "number"], name="unique_user_package_number"
@@ -160,6 +161,13 @@ class TransportCompany(models.Model):
         verbose_name = "Транспортная компания"
         verbose_name_plural = "Транспортные компании"
         ordering = ("name",)
+        constraints = [
+            models.UniqueConstraint(
+                fields=["is_default"],
+                condition=models.Q(is_default=True),
+                name="unique_default_transport_company",
+            )
+        ]
 
     def __str__(self):
         """Строковое представление модели."""
@@ -171,6 +179,17 @@ class TransportCompany(models.Model):
         if not self.name:
             raise ValidationError({"name": "Название компании обязательно"})
 
+    def validate_constraints(self, exclude=None):
+        """
+        Проверка ограничений модели без unique_default_transport_company.
+
+        Предыдущую ТК по умолчанию снимает save(), поэтому проверка флага
+        is_default в full_clean() мешала бы переключению в админке.
+        От гонок защищает частичный уникальный индекс в базе.
+        """
+        exclude = set(exclude or ()) | {"is_default"}
+        super().validate_constraints(exclude=exclude)
+
     def save(self, *args, **kwargs):
         """Сохранение с обработкой флага is_default."""
         if self.is_default:
@@ -257,6 +276,10 @@ class PackageDelivery(models.Model):
 
         verbose_name = "Доставка посылки"
         verbose_name_plural = "Доставки посылок"
+        indexes = [
+            models.Index(fields=["status", "transport_company"]),
+            models.Index(fields=["created_at"]),
+        ]
         # Добавляем ограничение уникальности на уровне базы данных
         constraints = [
             models.UniqueConstraint(fields=["package"], name="unique_package_delivery")
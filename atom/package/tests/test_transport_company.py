@@ -1,6 +1,9 @@
 import pytest
+from django.contrib.admin.sites import AdminSite
 from django.core.exceptions import ValidationError
+from django.test import RequestFactory
 
+from package.admin import TransportCompanyAdmin
 from package.models import TransportCompany, PackageDelivery, Package
 from status.models import Status
 
@@ -16,7 +19,7 @@ def valid_company_data():
     }
 
 
-@pytest.mark.django_db(transaction=True)
+@pytest.mark.django_db
 class TestTransportCompany:
     """Тесты для модели TransportCompany."""
 
@@ -178,3 +181,34 @@ class TestTransportCompany:
 
         # Проверяем что только одна компания по умолчанию
         assert TransportCompany.objects.filter(is_default=True).count() == 1
+
+    def test_default_company_switch_in_admin(self, valid_company_data):
+        """Тест переключения компании по умолчанию через форму админки."""
+        first_company = TransportCompany.objects.create(
+            **{**valid_company_data, "name": "Company A", "is_default": True}
+        )
+        second_company = TransportCompany.objects.create(
+            **{**valid_company_data, "name": "Company B"}
+        )
+
+        model_admin = TransportCompanyAdmin(TransportCompany, AdminSite())
+        request = RequestFactory().post("/")
+        form_class = model_admin.get_form(request, second_company)
+        form = form_class(
+            data={
+                "name": second_company.name,
+                "description": second_company.description,
+                "is_active": True,
+                "is_default": True,
+            },
+            instance=second_company,
+        )
+
+        assert form.is_valid(), form.errors
+        model_admin.save_model(request, form.save(commit=False), form, change=True)
+
+        first_company.refresh_from_db()
+        second_company.refresh_from_db()
+        assert first_company.is_default is False
+        assert second_company.is_default is True
+        assert TransportCompany.objects.filter(is_default=True).count() == 1
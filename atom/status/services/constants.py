@@ -10,6 +10,10 @@
     - get_status_codes: Получение кодов статусов
     - get_status_choices: Получение списка статусов для выбора
     - get_default_status: Получение статуса по умолчанию
+    - get_default_status_id: Получение ID статуса по умолчанию (с кэшем)
+    - get_status_id: Получение ID статуса группы по коду (с кэшем)
+    - get_transaction_type: Получение типа транзакции для статуса (с кэшем)
+    - invalidate_transaction_type: Сброс кэша типов транзакций группы
 
 Процесс работы:
     1. Определение типа контента для модели
@@ -37,9 +41,16 @@
     - Обеспечивается консистентность данных
 """
 
+from functools import lru_cache
+
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+
+from ..models import Status, StatusGroup
 
-from ..models import Status
+# Время жизни кэша типов транзакций в секундах
+TRANSACTION_TYPE_CACHE_TIMEOUT = 300
+_TRANSACTION_TYPE_CACHE_KEY = "status:transaction_types:{}"
 
 
 def get_status_descriptions(model_class, group_code=None):
@@ -156,3 +167,94 @@ def get_default_status(model_class, group_code=None):
         return queryset.order_by("order").first().code
     except Status.DoesNotExist:
         return None
+
+
+@lru_cache(maxsize=8)
+def get_default_status_id(model_class, group_code=None):
+    """
+    Получить идентификатор статуса по умолчанию с кэшированием.
+
+    Кэш хранится в памяти процесса и сбрасывается сигналами после фиксации
+    транзакции, в которой сохранен или удален любой статус. Сигналы
+    не срабатывают в других процессах и при QuerySet.update(), поэтому
+    после массового изменения статусов кэш нужно сбросить вручную через
+    cache_clear().
+
+    Args:
+        model_class: Класс модели
+        group_code: Код группы статусов (опционально)
+
+    Returns:
+        int | None: ID статуса по умолчанию
+    """
+    content_type = ContentType.objects.get_for_model(model_class)
+    queryset = Status.objects.filter(group__content_type=content_type, is_default=True)
+
+    if group_code:
+        queryset = queryset.filter(group__code=group_code)
+
+    return queryset.order_by("order").values_list("id", flat=True).first()
+
+
+@lru_cache(maxsize=32)
+def get_status_id(group_code, status_code):
+    """
+    Получить идентификатор статуса группы по коду с кэшированием.
+
+    Кэш хранится в памяти процесса и сбрасывается сигналами после фиксации
+    транзакции, в которой сохранен или удален любой статус. Сигналы
+    не срабатывают в других процессах и при QuerySet.update(), поэтому
+    после массового изменения статусов кэш нужно сбросить вручную через
+    cache_clear().
+
+    Args:
+        group_code: Код группы статусов
+        status_code: Код статуса
+
+    Returns:
+        int | None: ID статуса или None, если статус не найден
+    """
+    return (
+        Status.objects.filter(group__code=group_code, code=status_code)
+        .values_list("id", flat=True)
+        .first()
+    )
+
+
+def get_transaction_type(group_id, status_code):
+    """
+    Получить тип транзакции для статуса группы с кэшированием.
+
+    Настройки группы хранятся в кэше Django не дольше
+    TRANSACTION_TYPE_CACHE_TIMEOUT секунд, поэтому изменения, сделанные
+    в другом процессе или через QuerySet.update(), видны после истечения
+    срока. Сохранение или удаление группы сбрасывает ключ после фиксации
+    транзакции.
+
+    Args:
+        group_id: ID группы статусов
+        status_code: Код статуса
+
+    Returns:
+        str | None: Тип транзакции или None, если транзакция не нужна
+    """
+    key = _TRANSACTION_TYPE_CACHE_KEY.format(group_id)
+    transaction_types = cache.get(key)
+    if transaction_types is None:
+        transaction_types = (
+            StatusGroup.objects.filter(pk=group_id)
+            .values_list("transaction_type_by_status", flat=True)
+            .first()
+        ) or {}
+        cache.set(key, transaction_types, TRANSACTION_TYPE_CACHE_TIMEOUT)
+    return transaction_types.get(status_code)
+
+
+def invalidate_transaction_type(group_id):
+    """
+    Сбросить кэш типов транзакций группы статусов.
+
+    Args:
+        group_id: ID группы статусов
+    """
+    cache.delete(_TRANSACTION_TYPE_CACHE_KEY.format(group_id))
@@ -42,39 +42,45 @@
     - Каждая фабрика работает только со своим типом объектов
     - При отсутствии стратегии вызывается ValidationError
     - Стратегии создаются только при необходимости
+    - Стратегии заказов создаются один раз и переиспользуются без запросов к БД
     - Поддерживается добавление новых стратегий
 """
 
 from django.apps import apps
 from django.core.exceptions import ValidationError
 
+from status.constants import OrderStatusCode
+
 from .constants import get_status_codes
 
 
 class OrderStatusStrategyFactory:
     """Фабрика для создания стратегий статусов заказов."""
 
+    # Стратегии заказов не хранят состояния, поэтому создаются один раз
+    _strategies = None
+
     @classmethod
     def _get_strategies(cls):
         """
         Получить словарь стратегий с кодами статусов.
 
         Returns:
-            dict: Словарь {код_статуса: класс_стратегии}
+            dict: Словарь {код_статуса: экземпляр_стратегии}
         """
-        Order = apps.get_model("order", "Order")
-        status_codes = get_status_codes(Order)
-        from order.services.order_strategies import (
-            NewOrderStrategy,
-            PaidOrderStrategy,
-            RefundedOrderStrategy,
-        )
+        if cls._strategies is None:
+            from order.services.order_strategies import (
+                NewOrderStrategy,
+                PaidOrderStrategy,
+                RefundedOrderStrategy,
+            )
 
-        return {
-            status_codes["new"]: NewOrderStrategy,
-            status_codes["paid"]: PaidOrderStrategy,
-            status_codes["refunded"]: RefundedOrderStrategy,
-        }
+            cls._strategies = {
+                OrderStatusCode.NEW.value: NewOrderStrategy(),
+                OrderStatusCode.PAID.value: PaidOrderStrategy(),
+                OrderStatusCode.REFUNDED.value: RefundedOrderStrategy(),
+            }
+        return cls._strategies
 
     @classmethod
     def get_strategy(cls, status):
@@ -91,12 +97,12 @@ class OrderStatusStrategyFactory:
             ValidationError: Если стратегия для статуса не найдена
         """
         status_code = status.code if hasattr(status, "code") else status
-        strategy_class = cls._get_strategies().get(status_code)
-        if not strategy_class:
+        strategy = cls._get_strategies().get(status_code)
+        if not strategy:
             raise ValidationError(
                 f"Стратегия для статуса {status} (код: {status_code}) не найдена"
             )
-        return strategy_class()
+        return strategy
 
 
 class DeliveryStatusStrategyFactory:
@@ -7,6 +7,8 @@
 Основные компоненты:
     - initialize_status_group: Функция инициализации группы статусов
     - create_default_status: Обработчик сигнала post_migrate
+    - clear_default_status_cache: Сброс кэшей идентификаторов статусов
+    - clear_transaction_type_cache: Сброс кэша типов транзакций
     - Конфигурация статусов для заказов и доставок
 
 Процесс инициализации:
@@ -40,9 +42,16 @@
 
 from django.apps import apps
 from django.contrib.contenttypes.models import ContentType
-from django.db.models.signals import post_migrate
+from django.db import transaction
+from django.db.models.signals import post_delete, post_migrate, post_save
 from django.dispatch import receiver
 
+from .models import Status, StatusGroup
+from .services.constants import (
+    get_default_status_id,
+    get_status_id,
+    invalidate_transaction_type,
+)
 from .services.initial_data import (
     ORDER_STATUS_CONFIG,
     DELIVERY_STATUS_CONFIG,
@@ -118,3 +127,22 @@ def create_default_status(sender, **kwargs):
         # Единый цикл для всех групп статусов
         for group_code, group_data in all_status.items():
             initialize_status_group(group_code, group_data, StatusGroup, Status)
+
+
+@receiver([post_save, post_delete], sender=Status)
+def clear_default_status_cache(sender, **kwargs):
+    """
+    Сброс кэшей идентификаторов статусов при изменении любого статуса.
+
+    Кэши сбрасываются только после фиксации транзакции: при откате
+    изменения статуса сохраненные идентификаторы остаются верными.
+    """
+    transaction.on_commit(get_default_status_id.cache_clear)
+    transaction.on_commit(get_status_id.cache_clear)
+
+
+@receiver([post_save, post_delete], sender=StatusGroup)
+def clear_transaction_type_cache(sender, instance, **kwargs):
+    """Сброс кэша типов транзакций группы после фиксации ее изменения."""
+    group_id = instance.pk
+    transaction.on_commit(lambda: invalidate_transaction_type(group_id))
@@ -9,6 +9,7 @@ from status.services.constants import (
     get_status_codes,
     get_status_choices,
     get_default_status,
+    get_transaction_type,
 )
 from order.models import Order
 from status.models import Status, StatusGroup
@@ -101,3 +102,19 @@ class TestStatusServices:
         default_status = get_default_status(Order)
 
         assert default_status == "new"
+
+    def test_get_transaction_type_cache_reset_on_group_save(
+        self, setup_statuses, django_capture_on_commit_callbacks
+    ):
+        """Тест сброса кэша типов транзакций после сохранения группы."""
+        group, _ = setup_statuses
+        assert get_transaction_type(group.id, "paid") == "EXPENSE"
+
+        with django_capture_on_commit_callbacks(execute=True):
+            group.transaction_type_by_status = {"paid": "PAYBACK"}
+            group.save()
+            # До фиксации транзакции в кэше остается прежнее значение
+            assert get_transaction_type(group.id, "paid") == "EXPENSE"
+
+        assert get_transaction_type(group.id, "paid") == "PAYBACK"
+        assert get_transaction_type(group.id, "new") is None
@@ -67,7 +67,7 @@ from order.models import Order
 from package.models import Package, PackageDelivery, PackageOrder
 
 
-@pytest.mark.django_db(transaction=True)
+@pytest.mark.django_db
 class TestOrderDeliveryFlow:
     """
     Тестирование полного цикла:
@@ -0,0 +1,19 @@
+"""Проверка согласованности миграций с моделями.
+
+Тесты запускаются с --nomigrations, поэтому миграции при создании
+тестовой базы не применяются. Этот тест включает их обратно и проверяет,
+что для текущих моделей не требуется новых миграций.
+"""
+
+import pytest
+from django.core.management import call_command
+
+
+@pytest.mark.django_db
+def test_no_missing_migrations(settings):
+    """Тест отсутствия изменений моделей без миграций."""
+    # Отменяем отключение миграций, которое делает --nomigrations
+    settings.MIGRATION_MODULES = {}
+
+    # makemigrations --check завершает процесс с кодом 1 при наличии изменений
+    call_command("makemigrations", "--check", "--dry-run", verbosity=0)
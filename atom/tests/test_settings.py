@@ -0,0 +1,19 @@
+"""Проверка настроек, которые действуют при запуске тестов."""
+
+import logging
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "logger_name",
+    [
+        "order",
+        "order.models.order",
+        "order.services.order_service",
+        "order.admin",
+    ],
+)
+def test_order_loggers_skip_info_in_tests(logger_name):
+    """Тест отключения INFO-записей журнала заказов при запуске тестов."""
+    assert logging.getLogger(logger_name).isEnabledFor(logging.INFO) is False